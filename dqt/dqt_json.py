@@ -3,8 +3,11 @@ import sys
 import os
 import shutil
 import subprocess
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from dqt.ui_utils import confirm, cont_on_enter, err, log_saved, print_wrapped
@@ -15,17 +18,66 @@ if TYPE_CHECKING:
 
 _UNSET: object = object()
 _today: datetime = datetime.today()
+# Project root (the directory containing `dqt`); resolved once at import
+_ROOTDIR: Path = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=None)
+def parse_date(date_str: str, date_format: str) -> datetime:
+    """Return `date_str` parsed with `date_format`.
+
+    Results are memoized; log dates are parsed repeatedly across the program
+    and `datetime.strptime` re-interprets the format on every call.
+    Zero-padded ISO dates in the default format go through the much faster
+    `datetime.fromisoformat` instead.
+    """
+    if (date_format == '%Y-%m-%d' and len(date_str) == 10
+            and date_str[4] == date_str[7] == '-'):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass  # Let strptime raise its usual error message
+    return datetime.strptime(date_str, date_format)
+
+
+def format_date(day: date, date_format: str) -> str:
+    """Return `day` formatted with `date_format`.
+
+    The default ISO format is built directly, skipping `strftime`.
+    """
+    if date_format == '%Y-%m-%d':
+        return f"{day.year:04d}-{day.month:02d}-{day.day:02d}"
+    return day.strftime(date_format)
+
+
+@lru_cache(maxsize=None)
+def today_str(date_format: str) -> str:
+    """Return today's date (as evaluated at startup) formatted as a string.
+
+    Cached per format, since `_today` does not change during runtime.
+    """
+    return format_date(_today, date_format)
 
 
 class DQTJSON:
     """A class to manage Day Quality Tracker JSON contents handling."""
     
+    __slots__ = (
+        'dqt',
+        'filedirname', 'rootdir', 'filedirpath', 'filename', 'filepath',
+        '_filename_pre5', '_filepath_pre5',
+        'rating_kyname', 'memory_kyname',
+        'json_indent',
+        '_raw_cache', '_batching', '_dirty', 'version',
+        'logs',
+    )
+    
     def __init__(self, dqt: Tracker):
         """Initialize attributes."""
         self.dqt: Tracker = dqt
         
         self.filedirname: str = 'data'
-        self.rootdir: Path = Path(__file__).resolve().parent.parent
+        self.rootdir: Path = _ROOTDIR
         self.filedirpath: Path = self.rootdir / self.filedirname
         self.filename: str = 'dq_logs.json'
         self.filepath: Path = self.filedirpath / self.filename
@@ -37,6 +89,15 @@ class DQTJSON:
         
         self.json_indent: int = 4
         
+        # (st_mtime_ns, st_size, st_ino) of the JSON file and its contents
+        self._raw_cache: tuple[tuple[int, int, int], dict] | None = None
+        self._batching: bool = False
+        # Whether logs changed inside the current `batch()` block
+        self._dirty: bool = False
+        # Incremented whenever `self.logs` changes, so other components can
+        # tell whether data derived from the logs is stale
+        self.version: int = 0
+        
         self._touch()
         
         self.logs: dict = self._load_json()
@@ -61,8 +122,12 @@ class DQTJSON:
             self.logs[date][self.rating_kyname] = rating
         if memory is not _UNSET:
             self.logs[date][self.memory_kyname] = memory
+        self.version += 1
         
-        self._dump()
+        if self._batching:
+            self._dirty = True
+        else:
+            self._dump()
     
     def add(self,
             date: str,
@@ -83,8 +148,31 @@ class DQTJSON:
             self.rating_kyname: rating,
             self.memory_kyname: memory
         }
+        self.version += 1
         
-        self._dump()
+        if self._batching:
+            self._dirty = True
+        else:
+            self._dump()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer dumping to the JSON file until the block exits.
+
+        Calls to `add()` and `update()` inside the block only change
+        `self.logs`. The logs are dumped once on exit, even if an exception
+        (e.g. a KeyboardInterrupt) is raised, so entered logs are not lost.
+        If nothing changed, the file is left untouched.
+        """
+        self._batching = True
+        self._dirty = False
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._dirty:
+                self._dirty = False
+                self._dump()
     
     def get_rating(self, date: str) -> float | None:
         """Return rating for given date."""
@@ -94,10 +182,26 @@ class DQTJSON:
         """Return memory entry for given date."""
         return self.logs[date][self.memory_kyname]
     
+    def average_rating(self) -> float | None:
+        """Return the average of all non-null ratings, or None if none.
+
+        The average is rounded to the rating input's decimal places.
+        """
+        rating_key = self.rating_kyname
+        ratings = [
+            log[rating_key]
+            for log in self.logs.values()
+            if log[rating_key] is not None
+        ]
+        if not ratings:
+            return None
+        # sum() rather than a running total: its compensated summation keeps
+        # the rounded average stable
+        return round(sum(ratings) / len(ratings), self.dqt.rating_inp_dp)
+    
     def today_rated(self) -> bool:
         """Check if a rating has been provided for today."""
-        today = _today.strftime(self.dqt.date_format)
-        return today in self.logs
+        return today_str(self.dqt.date_format) in self.logs
     
     def print_log(self,
                   date: str = _UNSET,
@@ -348,21 +452,24 @@ class DQTJSON:
     
     def _touch(self) -> None:
         """Check if JSON file exists, create if not."""
+        # Common case: a single stat when the file (and so its directory)
+        # already exists
+        if self.filepath.exists():
+            return
         if not self.filedirpath.exists():
             print(f"\nCreating `{self.filedirname}` directory...")
             self.filedirpath.mkdir()
             print("Success!")
-        if not self.filepath.exists():
-            if self._filepath_pre5.exists():
-                print(f"\nRenaming pre-DQT-5 JSON file...")
-                self._filepath_pre5.rename(self.filename)
-                print("Moving file...")
-                shutil.move(self.filename, self.filedirpath)
-                print("Success!")
-            else:
-                print(f"\nCreating `{self.filename}`...")
-                self.filepath.touch()
-                print("Success!")
+        if self._filepath_pre5.exists():
+            print(f"\nRenaming pre-DQT-5 JSON file...")
+            self._filepath_pre5.rename(self.filename)
+            print("Moving file...")
+            shutil.move(self.filename, self.filedirpath)
+            print("Success!")
+        else:
+            print(f"\nCreating `{self.filename}`...")
+            self.filepath.touch()
+            print("Success!")
                 
     def _load_json(self) -> dict:
         """Load, validate, and normalize JSON log data."""
@@ -375,16 +482,24 @@ class DQTJSON:
         """Load raw JSON contents from disk.
 
         Returns an empty dict if the file does not exist or is empty.
+        The parsed contents are cached until the file's modification time,
+        size, or inode changes, so repeated checks don't re-read the file.
+        The returned dict must not be mutated.
         """
-        if not self.filepath.exists():
+        try:
+            st = self.filepath.stat()
+        except FileNotFoundError:
             return {}
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if self._raw_cache is not None and self._raw_cache[0] == sig:
+            return self._raw_cache[1]
         
-        text = self.filepath.read_text().strip()
-        if not text:
-            return {}
+        # Read once; json.loads() takes bytes and detects the encoding itself
+        raw = self.filepath.read_bytes()
+        contents = json.loads(raw) if raw.strip() else {}
         
-        with open(self.filepath, 'r') as file:
-            return json.load(file)
+        self._raw_cache = (sig, contents)
+        return contents
     
     def _validate_and_normalize_logs(
             self,
@@ -396,15 +511,21 @@ class DQTJSON:
         - Auto-fills missing memory entries (optional)
         """
         prev_date = None
+        prev_d = None
         validated: dict[str, dict[str, float | None | str]] = {}
         updated = False
+        # Bind loop invariants to locals
+        date_format = self.dqt.date_format
+        autofill = self.dqt.autofill_json
+        rating_key = self.rating_kyname
+        memory_key = self.memory_kyname
         
         for date, value in contents.items():
             
             # ---------- Validate date order ----------
-            if prev_date is not None:
-                prev_d = datetime.strptime(prev_date, self.dqt.date_format)
-                d = datetime.strptime(date, self.dqt.date_format)
+            # Each date is parsed once and carried over to the next entry
+            d = parse_date(date, date_format)
+            if prev_d is not None:
                 diff = (d - prev_d).days
                 if diff < 0:
                     raise ValueError(
@@ -417,6 +538,7 @@ class DQTJSON:
                     )
             
             prev_date = date
+            prev_d = d
             
             # Format:
             # {
@@ -427,28 +549,28 @@ class DQTJSON:
             # }
             if isinstance(value, dict):
                 try:
-                    raw_rating = value[self.rating_kyname]
+                    raw_rating = value[rating_key]
                 except KeyError:
-                    if not self.dqt.autofill_json:
+                    if not autofill:
                         raise KeyError(
-                            f"'{self.rating_kyname}' key not found for date "
+                            f"'{rating_key}' key not found for date "
                             f"'{date}'")
                     raw_rating = None
                     updated = True
                 rating = None if raw_rating is None else float(raw_rating)
                 try:
-                    memory = value[self.memory_kyname]
+                    memory = value[memory_key]
                 except KeyError:
-                    if not self.dqt.autofill_json:
+                    if not autofill:
                         raise KeyError(
-                            f"'{self.memory_kyname}' key not found for date "
+                            f"'{memory_key}' key not found for date "
                             f"'{date}'")
                     memory = ''
                     updated = True
                 
                 validated[date] = {
-                    self.rating_kyname: rating,
-                    self.memory_kyname: memory
+                    rating_key: rating,
+                    memory_key: memory
                 }
                 
                 continue
@@ -475,10 +597,10 @@ class DQTJSON:
         contains data and the logs to be dumped are empty.
         """
         logs_to_dump = self.logs if logs is None else logs
-        raw_json = self._load_raw_json()
         
-        # Prevent overwriting existing data with an empty logs dict
-        if raw_json and not logs_to_dump:
+        # Prevent overwriting existing data with an empty logs dict. The file
+        # only needs reading when there is nothing to dump
+        if not logs_to_dump and self._load_raw_json():
             print(
                 Txt(
                     "\n(The program tried to save an empty logs dict. Logs "
@@ -488,12 +610,28 @@ class DQTJSON:
             )
             return
         
-        with open(self.filepath, "w") as file:
-            json.dump(
-                logs_to_dump,
-                file,
-                indent=self.json_indent
-            )
+        # Encode up front so the file is written in one call rather than
+        # one small write per JSON token. Write to a temporary file and swap
+        # it in, so a crash mid-write can't leave a truncated logs file.
+        data = json.dumps(logs_to_dump, indent=self.json_indent)
+        # Resolved so a symlinked logs file is updated, not replaced
+        target = self.filepath.resolve()
+        tmp_path = target.with_name(target.name + '.tmp')
+        try:
+            with open(tmp_path, "w") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            # Keep the permissions of the file being replaced
+            if target.exists():
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            # Don't leave a partial temporary file behind
+            tmp_path.unlink(missing_ok=True)
+            raise
+        # mtime granularity can be coarse; don't trust the old signature
+        self._raw_cache = None
     
     def no_logs(self, check_file: bool = True) -> bool:
         """Determine whether there are no logs available.
@@ -525,6 +663,7 @@ class DQTJSON:
             "Load now?"
         ):
             self.logs = self._load_json()
+            self.version += 1
             return False
         
         return True
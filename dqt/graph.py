@@ -3,38 +3,57 @@ import math
 from subprocess import check_call
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
-from types import NoneType
+from types import ModuleType, NoneType
 
-from dqt.dqt_json import DQTJSON
-from dqt.ui_utils import err, confirm
+from dqt.dqt_json import DQTJSON, format_date, parse_date
+from dqt.ui_utils import confirm
 
-try:
+if TYPE_CHECKING:
     import matplotlib.pyplot as plt
-except ModuleNotFoundError:
-    print("\nThe python package 'matplotlib' is required before running.")
-
-    if not confirm("Install now?"):
-        raise SystemExit()
+    from dqt.tracker import Tracker
 
-    check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
-    check_call([sys.executable, "-m", "pip", "install", "matplotlib"])
 
-    print("\nInstallation complete!")
+def _pyplot() -> ModuleType:
+    """Import and return `matplotlib.pyplot`.
 
+    Imported on first use rather than at module load, since it is slow to
+    import and only needed once a graph is shown. If matplotlib is missing,
+    the user is offered to install it.
+    
+    Raises:
+        ModuleNotFoundError: matplotlib is still not available
+    """
     try:
         import matplotlib.pyplot as plt
     except ModuleNotFoundError:
-        err(
-            "Matplotlib was installed, but could not be imported.",
-            "Please restart the program."
+        print("\nThe python package 'matplotlib' is required to show the "
+              "graph.")
+        
+        if not confirm("Install now?"):
+            raise ModuleNotFoundError(
+                "Matplotlib is not installed, so the graph can't be shown",
+                name='matplotlib'
+            ) from None
+        
+        check_call(
+            [sys.executable, "-m", "pip", "install", "--upgrade", "pip"]
         )
-        raise SystemExit()
-
-    print("Resuming program...\n")
-
-
-if TYPE_CHECKING:
-    from dqt.tracker import Tracker
+        check_call([sys.executable, "-m", "pip", "install", "matplotlib"])
+        
+        print("\nInstallation complete!")
+        
+        try:
+            import matplotlib.pyplot as plt
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "Matplotlib was installed, but could not be imported. "
+                "Please restart the program",
+                name='matplotlib'
+            ) from None
+        
+        print("Resuming program...\n")
+    
+    return plt
 
 
 class Graph:
@@ -149,23 +168,23 @@ class Graph:
         
     def _build(self) -> None:
         """Build the graph and initialize plt, fig, and ax properties."""
-        logs = self.json.logs
         if self.json.no_logs():
             raise ValueError("No logs saved")
+        logs = self.json.logs
         
+        # Logs are validated to be in date order on load, so only the first
+        # and last dates need parsing
+        date_format = self.dqt.date_format
         dates, ratings = self._fill_missing(
-            sorted(
-                datetime.strptime(d, self.dqt.date_format)
-                for d in self.json.logs.keys()
-            )
+            parse_date(next(iter(logs)), date_format),
+            parse_date(next(reversed(logs)), date_format),
         )
         
+        plt = _pyplot()
+        
         # Close existing windows to prevent overlapping
         plt.close('all')
         
-        if not logs:
-            raise ValueError("No logs saved")
-        
         plt.style.use(self.graph_style)
         fig, ax = plt.subplots()
         
@@ -175,8 +194,11 @@ class Graph:
         
         self._plot_ratings(ax, dates, ratings)
         self._draw_neutral_rating_line(ax)
-        self._draw_average_rating_line(ax, ratings)
-        self._plot_highest_lowest_ratings(ax, dates, ratings)
+        
+        avg = self.json.average_rating()
+        if avg is not None:
+            self._draw_average_rating_line(ax, avg)
+            self._plot_highest_lowest_ratings(ax, dates, ratings)
         
         self._draw_year_labels(ax, dates)
         
@@ -186,13 +208,14 @@ class Graph:
         
     def _show(self) -> None:
         """Show the graph."""
+        plt = _pyplot()
         plt.show(block=self.graph_show_block)
         plt.pause(0.1)
     
     @staticmethod
     def close() -> None:
         """Close the graph."""
-        plt.close('all')
+        _pyplot().close('all')
         
     def configure(self, **configs: str | float | int | bool | tuple) -> None:
         """Update configuration options via keyword arguments.
@@ -220,23 +243,28 @@ class Graph:
                 )
             setattr(self, config_name, value)
         
-    def _fill_missing(self, dates: list[datetime]) \
+    def _fill_missing(self, start: datetime, end: datetime) \
             -> tuple[list[datetime], list[float | None]]:
-        """Fill in missing ratings with None."""
-        start = dates[0]
-        end = dates[-1]
-        
+        """Return every date from `start` to `end` and its rating.
+
+        Days without a log get a rating of None.
+        """
         full_dates = []
         full_ratings = []
         
+        # Bind loop invariants to locals
+        date_format = self.dqt.date_format
+        logs = self.json.logs
+        rating_key = self.json.rating_kyname
+        one_day = timedelta(days=1)
+        
         current = start
         while current <= end:
-            key = current.strftime(self.dqt.date_format)
+            key = format_date(current, date_format)
             full_dates.append(current)
-            full_ratings.append(
-                self.json.logs.get(key, {}).get(self.json.rating_kyname)
-            )
-            current += timedelta(days=1)
+            log = logs.get(key)
+            full_ratings.append(None if log is None else log.get(rating_key))
+            current += one_day
             
         return full_dates, full_ratings
     
@@ -301,24 +329,29 @@ class Graph:
         )
     
     def _draw_year_labels(self, ax: plt.Axes, dates: list[datetime]) -> None:
-        """Draw year labels."""
-        shown_years = set()
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year not in shown_years:
-                x = i / (len(dates) - 1) if len(dates) > 1 else 0.5
-                ax.text(
-                    x,
-                    1,
-                    str(year),
-                    transform=ax.transAxes,
-                    ha='center',
-                    va='bottom',
-                    fontsize=self.year_labels_fontsize,
-                    fontweight=self.year_labels_fontweight
-                )
-                shown_years.add(year)
+        """Draw year labels.
+        
+        Each year is labelled above its first date. `dates` holds every day
+        in the graphed range, so that date's index is computed directly
+        instead of scanning the dates.
+        """
+        start = dates[0]
+        last_index = len(dates) - 1
+        transform = ax.transAxes
+        
+        for year in range(start.year, dates[-1].year + 1):
+            i = max((datetime(year, 1, 1) - start).days, 0)
+            x = i / last_index if last_index else 0.5
+            ax.text(
+                x,
+                1,
+                str(year),
+                transform=transform,
+                ha='center',
+                va='bottom',
+                fontsize=self.year_labels_fontsize,
+                fontweight=self.year_labels_fontweight
+            )
     
     def _draw_neutral_rating_line(self, ax: plt.Axes) -> None:
         """Draw horizontal neutral rating line."""
@@ -330,43 +363,49 @@ class Graph:
             label=self.neutralline_label,
         )
         
-    def _draw_average_rating_line(self, ax: plt.Axes,
-                                  ratings: list[float | None]) -> None:
+    def _draw_average_rating_line(self, ax: plt.Axes, avg: float) -> None:
         """Draw horizontal average rating line."""
-        avg = self._average_rating(ratings)
-        if avg is None:
-            return
         ax.axhline(
-            y=round(avg, self.dqt.rating_inp_dp),
+            y=avg,
             color=self.averageline_color,
             linewidth=self.averageline_width,
             linestyle=self.averageline_style,
             label=self.averageline_label,
         )
     
-    def _average_rating(self, ratings: list[float | None]) -> float | None:
-        """Return average rating."""
-        clean = [r for r in ratings if r is not None]
-        if not clean:
-            return None
-        return round(sum(clean) / len(clean), self.dqt.rating_inp_dp)
-    
     def _plot_highest_lowest_ratings(self,
                                      ax: plt.Axes,
                                      dates: list[datetime],
                                      ratings: list[float | None]) -> None:
         """Plot highest and lowest rating values as points."""
-        indexed = [(i, r) for i, r in enumerate(ratings) if r is not None]
-        if not indexed:
+        max_val = min_val = None
+        max_indices: list[int] = []
+        min_indices: list[int] = []
+        
+        # Find both extremes and their positions in a single pass
+        for i, r in enumerate(ratings):
+            if r is None:
+                continue
+            if max_val is None:
+                max_val = min_val = r
+                max_indices = [i]
+                min_indices = [i]
+                continue
+            
+            if r > max_val:
+                max_val = r
+                max_indices = [i]
+            elif r == max_val:
+                max_indices.append(i)
+            if r < min_val:
+                min_val = r
+                min_indices = [i]
+            elif r == min_val:
+                min_indices.append(i)
+        
+        if max_val is None:
             return
         
-        values = [r for _, r in indexed]
-        max_val = max(values)
-        min_val = min(values)
-        
-        max_indices = [i for i, r in indexed if r == max_val]
-        min_indices = [i for i, r in indexed if r == min_val]
-        
         ax.scatter(
             [dates[i] for i in max_indices],
             [max_val] * len(max_indices),
@@ -1,8 +1,9 @@
+import re
 from textwrap import dedent
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
-from dqt.dqt_json import DQTJSON
+from dqt.dqt_json import DQTJSON, format_date, parse_date, today_str
 from dqt.ui_utils import (
     confirm,
     err,
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
     from tracker import Tracker
 
 _today: datetime = datetime.today()
+_RATING_RE: re.Pattern[str] = re.compile(r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)')
 
 
 class Manager:
@@ -39,10 +41,10 @@ class Manager:
         if self.json.no_logs():  # Ignore for first-time runs (empty dict)
             return None
         
-        last_date_str = max(self.dqt.json.logs.keys())
-        last_date = datetime.strptime(
-            last_date_str, self.dqt.date_format
-        ).date()
+        # Logs are validated to be in date order on load, so the last key is
+        # the most recent date
+        last_date_str = next(reversed(self.json.logs))
+        last_date = parse_date(last_date_str, self.dqt.date_format).date()
         days_since_last = (_today.date() - last_date).days
         
         if days_since_last <= 1:
@@ -63,28 +65,29 @@ class Manager:
             match choice:
                 
                 case '1':
-                    # Get list of missed dates
-                    missed_dates = []
-                    curr_loop_date = last_date + timedelta(days=1)
-                    #                               Exclude today
-                    while len(missed_dates) < days_since_last - 1:
-                        missed_dates.append(curr_loop_date)
-                        curr_loop_date += timedelta(days=1)
+                    # Get list of missed dates (excluding today)
+                    missed_dates = [
+                        last_date + timedelta(days=i)
+                        for i in range(1, days_since_last)
+                    ]
+                    date_format = self.dqt.date_format
                     
-                    for date in missed_dates:
-                        rating = self._input_rating(
-                            f"Enter your rating for {date} "
-                            f"({self.dqt.min_rating}~{self.dqt.max_rating}, "
-                            f"or 'null' to skip): ",
-                        )
-                        
-                        memory = self._input_memory(
-                            "Enter a memory entry (leave blank to skip): "
-                        )
-                        
-                        date_str = datetime.strftime(date, self.dqt.date_format)
-                        
-                        self.json.add(date_str, rating, memory)
+                    # Save once after all missed logs are entered
+                    with self.json.batch():
+                        for date in missed_dates:
+                            rating = self._input_rating(
+                                f"Enter your rating for {date} "
+                                f"({self.dqt.min_rating}~"
+                                f"{self.dqt.max_rating}, or 'null' to skip): ",
+                            )
+                            
+                            memory = self._input_memory(
+                                "Enter a memory entry (leave blank to skip): "
+                            )
+                            
+                            date_str = format_date(date, date_format)
+                            
+                            self.json.add(date_str, rating, memory)
                     
                     log_saved()
                     
@@ -152,7 +155,7 @@ class Manager:
                 )
             
             # Save data
-            today = _today.strftime(self.dqt.date_format)
+            today = today_str(self.dqt.date_format)
             self.json.add(today, tdys_rating, tdys_memory)
             log_saved()
         
@@ -178,6 +181,10 @@ class Manager:
         """Prompt the user to change today's memory entry."""
         self._change_data('today', self.json.memory_kyname)
     
+    def change_todays_both(self) -> None:
+        """Prompt the user to change today's rating and memory entry."""
+        self._change_both('today')
+    
     def prompt_prev_date(self) -> str:
         """Prompt the user to enter a previous date."""
         while True:
@@ -189,13 +196,15 @@ class Manager:
             if inp.isdigit():
                 inp = int(inp)
                 selected_date = _today - timedelta(days=inp)
-                selected_date = selected_date.strftime(self.dqt.date_format)
+                selected_date = format_date(
+                    selected_date, self.dqt.date_format
+                )
                 print(Txt(f"Date selected: {selected_date}").bold())
             
             # Else, validate date str
             else:
                 try:
-                    datetime.strptime(inp, self.dqt.date_format)
+                    parse_date(inp, self.dqt.date_format)
                 except ValueError:
                     err("Enter wither a valid date in the "
                         f"format {self.dqt.date_format_print} or a positive "
@@ -204,9 +213,7 @@ class Manager:
                 selected_date = inp
             
             # Check if date exists in saved ratings
-            try:
-                self.json.logs[selected_date]
-            except KeyError:
+            if selected_date not in self.json.logs:
                 err(
                     "Rating for specified date not found.",
                     "Ensure you have already entered a "
@@ -226,6 +233,25 @@ class Manager:
         """Prompt the user to change a memory entry from a previous day."""
         self._change_data(selected_date, self.json.memory_kyname)
     
+    def change_previous_both(self, selected_date: str) -> None:
+        """Prompt the user to change a previous rating and memory entry."""
+        self._change_both(selected_date)
+    
+    def _change_both(self, selected_date: str) -> None:
+        """Change the rating and memory entry for a date, saving once.
+        
+        As in `_change_data()`, 'today' selects today's date.
+        """
+        if selected_date == 'today':
+            selected_date = today_str(self.dqt.date_format)
+        
+        # Saved once the block exits, so report it only then
+        with self.json.batch():
+            self._change_rating_for_date(selected_date, report=False)
+            self._change_memory_for_date(selected_date, report=False)
+        
+        log_saved("Log updated and saved!")
+    
     def _change_data(self, selected_date: str, changing: str) -> None:
         """Change data for the selected date and update JSON.
         
@@ -243,25 +269,33 @@ class Manager:
             )
         
         if selected_date == 'today':
-            selected_date = _today.strftime(self.dqt.date_format)
+            selected_date = today_str(self.dqt.date_format)
         
         if changing == self.json.rating_kyname:
             self._change_rating_for_date(selected_date)
         else:
             self._change_memory_for_date(selected_date)
     
-    def _change_rating_for_date(self, date: str) -> None:
-        """Prompt the user to update a rating for a date and save it."""
+    def _change_rating_for_date(self, date: str, report: bool = True) -> None:
+        """Prompt the user to update a rating for a date and save it.
+
+        If `report` is False, the save is not reported to the user (e.g.
+        when the update is batched and not yet written).
+        """
         new_rating = self._input_rating(
             f"Enter new rating for {date} "
             f"({self.dqt.min_rating}~{self.dqt.max_rating}): "
         )
         
         self.json.update(date=date, rating=new_rating)
-        log_saved("Rating updated and saved!")
+        if report:
+            log_saved("Rating updated and saved!")
     
-    def _change_memory_for_date(self, date: str) -> None:
-        """Prompt the user to update a memory entry for a date and save it."""
+    def _change_memory_for_date(self, date: str, report: bool = True) -> None:
+        """Prompt the user to update a memory entry for a date and save it.
+
+        `report` works as in `_change_rating_for_date()`.
+        """
         original_mem = self.json.logs[date][self.json.memory_kyname]
         placeholder = self.memory_edit_placeholder
         
@@ -281,7 +315,8 @@ class Manager:
         
         new_memory = self._confirm_memory_edit(raw, original_mem, date)
         self.json.update(date=date, memory=new_memory)
-        log_saved("Memory entry updated and saved!")
+        if report:
+            log_saved("Memory entry updated and saved!")
     
     def _confirm_memory_edit(self, raw: str, original: str, date: str) -> str:
         """Validate, preview, and confirm an edited memory entry.
@@ -328,22 +363,25 @@ class Manager:
     
     def _resolve_memory_edit(self, mem_input: str, original_mem: str) -> str:
         """Replace the first instance of the placeholder with the original."""
-        if self.memory_edit_placeholder in mem_input:
-            print("\n(Original memory entry has been inserted into your edit)")
-            return mem_input.replace(
-                self.memory_edit_placeholder, original_mem, 1
-            )
-        return mem_input
+        placeholder = self.memory_edit_placeholder
+        idx = mem_input.find(placeholder)
+        if idx == -1:
+            return mem_input
+        print("\n(Original memory entry has been inserted into your edit)")
+        end = idx + len(placeholder)
+        return mem_input[:idx] + original_mem + mem_input[end:]
     
     def _input_rating(self, prompt: str, newline: bool = True) -> float | None:
         """Get and validate user float input."""
+        min_rating = self.dqt.min_rating
+        max_rating = self.dqt.max_rating
         error_msg = (
-            f"Please enter a valid number from "
-            f"{self.dqt.min_rating} to {self.dqt.max_rating}."
+            f"Please enter a valid number from {min_rating} to {max_rating}."
         )
+        full_prompt = f"{"\n" if newline else ""}{prompt}"
         
         while True:
-            raw = input(f"{"\n" if newline else ""}{prompt}").lower().strip()
+            raw = input(full_prompt).lower().strip()
             
             if raw == '-':
                 if confirm(
@@ -352,13 +390,13 @@ class Manager:
                     return None
                 continue
             
-            try:
-                value = float(raw)
-            except ValueError:
+            # Reject non-numeric input without raising from float()
+            if not _RATING_RE.fullmatch(raw):
                 err(error_msg)
                 continue
+            value = float(raw)
             
-            if not (self.dqt.min_rating <= value <= self.dqt.max_rating):
+            if not (min_rating <= value <= max_rating):
                 err(error_msg)
                 continue
             
@@ -367,13 +405,14 @@ class Manager:
     @staticmethod
     def _input_memory(prompt: str, newline: bool = True) -> str:
         """Prompt user for today's memory entry."""
+        full_prompt = (
+            f"{"\n" if newline else ""}"
+            f"{prompt}"
+            f"{"\n" if newline else ""}"
+            f"\n->: "
+        )
         while True:
-            tdys_mem = input(
-                f"{"\n" if newline else ""}"
-                f"{prompt}"
-                f"{"\n" if newline else ""}"
-                f"\n->: "
-            ).strip()
+            tdys_mem = input(full_prompt).strip()
             
             if not tdys_mem:
                 if confirm(
@@ -1,14 +1,21 @@
-from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
-from dqt.dqt_json import DQTJSON
+from dqt.dqt_json import DQTJSON, parse_date
 from dqt.styletext import StyleText as Txt
 
 if TYPE_CHECKING:
     from tracker import Tracker
 
 
+@lru_cache(maxsize=None)
+def _weekday_of(date_str: str, date_format: str) -> str:
+    """Return the full weekday name (e.g. 'Monday') of a date string."""
+    return parse_date(date_str, date_format).strftime("%A")
+
+
 class Stats:
     """A class to manage stats display."""
     
@@ -17,6 +24,11 @@ class Stats:
         self.dqt: Tracker = dqt
         self.json: DQTJSON = dqt.json
         
+        # ((logs version, date format), weekday averages)
+        self._weekday_cache: (
+            tuple[tuple[int, str], dict[str, float]] | None
+        ) = None
+        
     def show_stats(self) -> None:
         """Show day quality rating stats.
 
@@ -41,22 +53,47 @@ class Stats:
         
         self._prnt_days_rated(logs, dates_to_ratings)
         
+        neutral_rat = self.dqt.neutral_rating
+        
         if not dates_to_ratings:
             print("Average rating: -")
             print("Highest rating: -")
             print("Lowest rating: -")
-            print(f"Days rated over {self.dqt.neutral_rating}: 0")
-            print(f"Days rated at {self.dqt.neutral_rating}: 0")
-            print(f"Days rated under {self.dqt.neutral_rating}: 0")
+            print(f"Days rated over {neutral_rat}: 0")
+            print(f"Days rated at {neutral_rat}: 0")
+            print(f"Days rated under {neutral_rat}: 0")
             print("Best days of the week: -")
             return
         
-        ratings_only = [r for _, r in dates_to_ratings]
+        # Gather the extremes and distribution in a single pass
+        highest = lowest = dates_to_ratings[0][1]
+        highest_dates: list[str] = []
+        lowest_dates: list[str] = []
+        over = at = under = 0
+        
+        for date, rating in dates_to_ratings:
+            if rating > highest:
+                highest = rating
+                highest_dates = [date]
+            elif rating == highest:
+                highest_dates.append(date)
+            if rating < lowest:
+                lowest = rating
+                lowest_dates = [date]
+            elif rating == lowest:
+                lowest_dates.append(date)
+            
+            if rating > neutral_rat:
+                over += 1
+            elif rating < neutral_rat:
+                under += 1
+            else:
+                at += 1
         
-        self._prnt_avg_rat(ratings_only)
-        self._prnt_hghst_lwst_rat(ratings_only, dates_to_ratings)
-        self._prnt_rats_dstrb(dates_to_ratings)
-        self._prnt_weekdays_rnked(dates_to_ratings)
+        self._prnt_avg_rat(self.json.average_rating())
+        self._prnt_hghst_lwst_rat(highest, highest_dates, lowest, lowest_dates)
+        self._prnt_rats_dstrb(over, at, under)
+        self._prnt_weekdays_rnked()
     
     @staticmethod
     def _prnt_days_rated(logs: dict[str, dict[str, float | None | str]],
@@ -72,85 +109,52 @@ class Stats:
         
         print(output)
         
-    def _prnt_rats_dstrb(self,
-                         dates_to_ratings: list[tuple[str, float]]) -> None:
+    def _prnt_rats_dstrb(self, over: int, at: int, under: int) -> None:
         """Print the distribution of ratings.
         
         Show number of ratings over, at, and under the neutral rating.
         """
         neutral_rat = self.dqt.neutral_rating
         
-        over = at = under = 0
-        
-        for _, rating in dates_to_ratings:
-            if rating > neutral_rat:
-                over += 1
-            elif rating < neutral_rat:
-                under += 1
-            else:
-                at += 1
-        
         print(Txt(f"Days rated over {neutral_rat}: {over}").bold())
         print(Txt(f"Days rated at {neutral_rat}: {at}").bold())
         print(Txt(f"Days rated under {neutral_rat}: {under}").bold())
     
-    def _prnt_avg_rat(self, ratings_only: list[float]) -> None:
-        """Print average rating for each day of the week."""
-        avg = round(
-            sum(ratings_only) / len(ratings_only),
-            self.dqt.rating_inp_dp
-        )
+    def _prnt_avg_rat(self, avg: float) -> None:
+        """Print average rating."""
         print(f"{Txt("Average rating:").bold()} "
               f"{Txt(f"{avg:g}").bold()}/{self.dqt.max_rating}")
     
     def _prnt_hghst_lwst_rat(self,
-                             ratings_only: list[float],
-                             dates_to_ratings: list[tuple[str, float]]) -> None:
+                             highest: float,
+                             highest_dates: list[str],
+                             lowest: float,
+                             lowest_dates: list[str]) -> None:
         """Print highest and lowest ratings, and the date for each.
         
         Prints the dates of ALL days that share the highest/lowest rating.
         """
-        highest = max(ratings_only)
-        lowest = min(ratings_only)
-        
-        highest_dates = [
-            date for date, rating in dates_to_ratings
-            if rating == highest
-        ]
-        lowest_dates = [
-            date for date, rating in dates_to_ratings
-            if rating == lowest
-        ]
-        
+        max_rating = self.dqt.max_rating
         print(
             f"{Txt("Highest rating:").bold()} "
-            f"{Txt(f"{highest:g}").bold()}/{self.dqt.max_rating} "
-            f"on {self._format_dates(highest_dates)}"
+            f"{Txt(f"{highest:g}").bold()}/{max_rating} "
+            f"on {', '.join(highest_dates)}"
         )
         print(
             f"{Txt("Lowest rating:").bold()} "
-            f"{Txt(f"{lowest:g}").bold()}/{self.dqt.max_rating} "
-            f"on {self._format_dates(lowest_dates)}"
+            f"{Txt(f"{lowest:g}").bold()}/{max_rating} "
+            f"on {', '.join(lowest_dates)}"
         )
     
-    def _prnt_weekdays_rnked(self,
-                             dates_to_ratings: list[tuple[str, float]]) -> None:
+    def _prnt_weekdays_rnked(self) -> None:
         """Print the days of the week in rank order of highest avg rating"""
-        weekday_scores: dict[str, list[float]] = defaultdict(list)
-        
-        for date_str, rating in dates_to_ratings:
-            date = datetime.strptime(date_str, self.dqt.date_format)
-            weekday = date.strftime("%A")
-            weekday_scores[weekday].append(rating)
-        
-        weekday_averages = {
-            day: sum(vals) / len(vals)
-            for day, vals in weekday_scores.items()
-        }
+        rating_inp_dp = self.dqt.rating_inp_dp
+        max_rating = self.dqt.max_rating
+        weekday_averages = self._weekday_averages()
         
         ranked_days = sorted(
             weekday_averages.items(),
-            key=lambda item: item[1],
+            key=itemgetter(1),
             reverse=True
         )
         
@@ -159,14 +163,36 @@ class Stats:
         counter = 0
         for day, value in ranked_days:
             counter += 1
-            cleaned_avg = f"{round(value, self.dqt.rating_inp_dp):g}"
+            cleaned_avg = f"{round(value, rating_inp_dp):g}"
             print(f"  #{counter} {Txt(day).bold()}: "
                   f"{Txt(cleaned_avg).bold()}"
-                  f"/{self.dqt.max_rating}")
+                  f"/{max_rating}")
     
-    @staticmethod
-    def _format_dates(dates: list[str]) -> str:
-        """Format dates as a string, separated by commas."""
-        return ", ".join(dates)
+    def _weekday_averages(self) -> dict[str, float]:
+        """Return the average rating for each day of the week.
 
-    
\ No newline at end of file
+        Null ratings are ignored. The result is cached until the logs or the
+        date format change.
+        """
+        date_format = self.dqt.date_format
+        sig = (self.json.version, date_format)
+        if self._weekday_cache is not None and self._weekday_cache[0] == sig:
+            return self._weekday_cache[1]
+        
+        weekday_scores: dict[str, list[float]] = defaultdict(list)
+        
+        rating_key = self.json.rating_kyname
+        for date_str, log in self.json.logs.items():
+            rating = log[rating_key]
+            if rating is None:
+                continue
+            weekday = _weekday_of(date_str, date_format)
+            weekday_scores[weekday].append(rating)
+        
+        weekday_averages = {
+            day: sum(vals) / len(vals)
+            for day, vals in weekday_scores.items()
+        }
+        
+        self._weekday_cache = (sig, weekday_averages)
+        return weekday_averages
@@ -1,9 +1,64 @@
 import os
 import sys
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 
+# SGR parameter of each style method
+_SGR: dict[str, int] = {
+    'bold': 1,
+    'dim': 2,
+    'italic': 3,
+    'underline': 4,
+    'red': 31,
+    'green': 32,
+    'yellow': 33,
+    'blue': 34,
+    'magenta': 35,
+    'cyan': 36,
+    'white': 37,
+}
 
+
+@lru_cache(maxsize=128)
+def _build_prefix(codes: tuple[int, ...]) -> str:
+    """Return the single escape sequence applying all SGR `codes`."""
+    return f"\033[{';'.join(map(str, codes))}m"
+
+
+@lru_cache(maxsize=512)
+def _render(codes: tuple[int, ...], text: str, reset: str) -> str:
+    """Return `text` styled with SGR `codes` and followed by `reset`.
+
+    Cached, since the same labels are rendered over and over by the menus.
+    """
+    if not codes:
+        # Nothing was styled, so there is nothing to reset
+        return text
+    return ''.join((_build_prefix(codes), text, reset))
+
+
+def _style_method(name: str) -> Callable[..., "StyleText"]:
+    """Return a StyleText method applying the SGR code of style `name`.
+
+    All style methods share this one code object, with the code bound in
+    the closure rather than looked up on every call.
+    """
+    code = _SGR[name]
+    
+    def style(self: "StyleText", reset: bool = True) -> "StyleText":
+        return self._add(code, reset)
+    
+    style.__name__ = name
+    style.__qualname__ = f"StyleText.{name}"
+    return style
+
+
+@lru_cache(maxsize=None)
 def _detect_ansi_support() -> bool:
-    """Determine if ANSI escape codes in stdout are supported."""
+    """Determine if ANSI escape codes in stdout are supported.
+
+    Cached, since the result does not change during runtime.
+    """
     # 1) Explicit override
     if 'DQT_COLOR' in os.environ:
         return os.environ['DQT_COLOR'] == '1'
@@ -34,6 +89,8 @@ def _detect_ansi_support() -> bool:
 class StyleText:
     """A class to create basic styled text with ANSI escape codes."""
     
+    __slots__ = ('text', 'codes', 'reset')
+    
     ansi_enabled: bool | None = _detect_ansi_support()
     
     RESET: str = '\033[0m' if ansi_enabled else ''
@@ -49,83 +106,75 @@ class StyleText:
             cls.ansi_enabled = _detect_ansi_support()
         else:
             cls.ansi_enabled = enabled
-            cls.RESET = '\033[0m' if enabled else ''
-    
-    def __init__(self, text: object, prefix: str = '', reset: bool = True):
-        self.text: str = str(text)
-        self.prefix: str = prefix
+        cls.RESET = '\033[0m' if cls.ansi_enabled else ''
+        # Pick the style implementation once, rather than on every call
+        cls._add = cls._add_styled if cls.ansi_enabled else cls._add_plain
+    
+    def __init__(self,
+                 text: object,
+                 codes: tuple[int, ...] = (),
+                 reset: bool = True):
+        self.text: str = text if type(text) is str else str(text)
+        # SGR parameters, emitted together as a single escape sequence
+        self.codes: tuple[int, ...] = codes
         self.reset: bool = reset
     
-    def _code(self, ansi: str) -> str:
-        """Return ANSI code or empty string depending on terminal support."""
-        return ansi if self.ansi_enabled else ''
+    @property
+    def prefix(self) -> str:
+        """Escape sequence applying all styles, or '' if there are none."""
+        if not self.codes:
+            return ''
+        return _build_prefix(self.codes)
     
-    def _add(self, code: str, reset: bool) -> "StyleText":
-        return StyleText(
-            self.text,
-            self.prefix + self._code(code),
-            reset=reset
-        )
+    def _add_styled(self, code: int, reset: bool) -> "StyleText":
+        return StyleText(self.text, self.codes + (code,), reset=reset)
     
-    # --- styles ---
-    def bold(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[1m', reset)
-    
-    def dim(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[2m', reset)
+    def _add_plain(self, code: int, reset: bool) -> "StyleText":
+        # Styling is a no-op without ANSI support
+        if reset == self.reset:
+            return self
+        return StyleText(self.text, self.codes, reset=reset)
     
-    def italic(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[3m', reset)
+    # Swapped by `set_ansi()`
+    _add = _add_styled if ansi_enabled else _add_plain
     
-    def underline(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[4m', reset)
+    # --- styles ---
+    bold = _style_method('bold')
+    dim = _style_method('dim')
+    italic = _style_method('italic')
+    underline = _style_method('underline')
     
     # --- colors ---
-    def red(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[31m', reset)
-    
-    def green(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[32m', reset)
-    
-    def yellow(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[33m', reset)
-    
-    def blue(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[34m', reset)
-    
-    def magenta(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[35m', reset)
-    
-    def cyan(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[36m', reset)
-    
-    def white(self, reset: bool = True) -> "StyleText":
-        return self._add('\033[37m', reset)
+    red = _style_method('red')
+    green = _style_method('green')
+    yellow = _style_method('yellow')
+    blue = _style_method('blue')
+    magenta = _style_method('magenta')
+    cyan = _style_method('cyan')
+    white = _style_method('white')
     
     def __str__(self) -> str:
-        if self.reset:
-            return f"{self.prefix}{self.text}{self.RESET}"
-        return f"{self.prefix}{self.text}"
+        return _render(self.codes, self.text, self.RESET if self.reset else '')
+    
+    @staticmethod
+    def render_many(items: Iterable["StyleText | str"], sep: str = '') -> str:
+        """Render all `items` and join them with `sep` in a single pass."""
+        return sep.join(map(str, items))
     
-    def __add__(self, other: str) -> "StyleText":
-        if not isinstance(other, str):
+    def __add__(self, other: str) -> str:
+        """Return the rendered text followed by `other`, as a plain str.
+
+        Concatenation ends the styling; `other` is not styled unless this
+        text was created with `reset=False`.
+        """
+        try:
+            return ''.join((str(self), other))
+        except TypeError:
             return NotImplemented
-        
-        if self.reset:
-            combined = f"{self.prefix}{self.text}{self.RESET}{other}"
-            return StyleText(combined, '', reset=False)
-        
-        return StyleText(
-            self.text + other,
-            self.prefix,
-            reset=False
-        )
-    
-    def __radd__(self, other: str) -> "StyleText":
-        if not isinstance(other, str):
+    
+    def __radd__(self, other: str) -> str:
+        """Return `other` followed by the rendered text, as a plain str."""
+        try:
+            return ''.join((other, str(self)))
+        except TypeError:
             return NotImplemented
-        return StyleText(
-            self.text,
-            other + self.prefix,
-            reset=self.reset
-        )
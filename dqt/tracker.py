@@ -1,16 +1,52 @@
-from datetime import datetime
-from typing import Literal
+from collections.abc import Callable
+from functools import cached_property, partial
+from typing import Literal, TYPE_CHECKING
 from types import NoneType
 
-from dqt.dqt_json import DQTJSON
+from dqt.dqt_json import DQTJSON, today_str
 from dqt.manager import Manager
-from dqt.graph import Graph
-from dqt.stats import Stats
 from dqt.ui_utils import cont_on_enter, err, invalid_choice, menu
 from dqt.styletext import StyleText as Txt
 
+if TYPE_CHECKING:
+    from dqt.graph import Graph
+    from dqt.stats import Stats
+
 _UNSET: object = object()
-_today: datetime = datetime.today()
+# handle_missing_logs() choices after which today's log is prompted
+_INPUT_LOG_CHOICES: frozenset[str | None] = frozenset({'1', '3', None})
+# Previous-log menu choices that go back to date selection
+_RESELECT_CHOICES: frozenset[str] = frozenset({'4', 'd'})
+
+_SEP_TOP: str = "\n*❖* —————————————————————————————— *❖*"
+_SEP_BOT: str = "\n*⎋* —————————————————————————————— *⎋*"
+_MAIN_MENU_ITEMS: tuple[str, ...] = (
+    "1) 📈 View ratings [G]raph",
+    "2) 📝 Edit [T]oday's log...",
+    "3) 🕗 Edit [P]revious log...",
+    "4) 📊 See [S]tats",
+    "5) 📂 View [A]ll logs...",
+    "6) 💾 [B]ack up logs...",
+    "7) E[x]it",
+)
+_TODAY_EDIT_ITEMS: tuple[str, ...] = (
+    "1) Edit [R]ating",
+    "2) Edit [M]emory entry",
+    "3) Edit [B]oth",
+    "4) [C]ancel -> Main menu",
+)
+_PREV_EDIT_ITEMS: tuple[str, ...] = (
+    "1) Edit [R]ating",
+    "2) Edit [M]emory entry",
+    "3) Edit [B]oth",
+    "4) Reselect [D]ate",
+    "5) [C]ancel -> Main menu",
+)
+_ALL_LOGS_ITEMS: tuple[str, ...] = (
+    "1) [P]rint logs to standard output",
+    "2) [O]pen JSON file in default viewer/editor",
+    "3) [C]ancel -> Main menu",
+)
 
 
 class Tracker:
@@ -33,7 +69,7 @@ class Tracker:
     }
     
     def __init__(self):
-        """Load saved data, initialize settings and Graph instance."""
+        """Load saved data and initialize settings."""
         # Initialize settings
         self.min_time: int = 20  # Earliest hour the of day to enter rating
         self.min_rating: int = 1  # 1 recommended
@@ -59,9 +95,33 @@ class Tracker:
             )
             raise SystemExit()
         
-        self.graph: Graph = Graph(self)
-        self.manager: Manager = Manager(self)
-        self.stats: Stats = Stats(self)
+        # Main menu choice -> handler
+        self._dispatch: dict[str, Callable[[], None]] = {
+            '1': self._handle_graph, 'g': self._handle_graph,
+            '2': self._handle_edit_today, 't': self._handle_edit_today,
+            '3': self._handle_edit_previous, 'p': self._handle_edit_previous,
+            '4': self._handle_stats, 's': self._handle_stats,
+            '5': self._handle_all_logs, 'a': self._handle_all_logs,
+            '6': self._handle_backup, 'b': self._handle_backup,
+            '7': self._handle_exit, 'x': self._handle_exit,
+        }
+    
+    @cached_property
+    def graph(self) -> Graph:
+        """Graph instance, created on first use."""
+        from dqt.graph import Graph
+        return Graph(self)
+    
+    @cached_property
+    def manager(self) -> Manager:
+        """Manager instance, created on first use."""
+        return Manager(self)
+    
+    @cached_property
+    def stats(self) -> Stats:
+        """Stats instance, created on first use."""
+        from dqt.stats import Stats
+        return Stats(self)
     
     def run(self) -> None:
         """Run Day Quality Tracker."""
@@ -78,166 +138,26 @@ class Tracker:
         
         choice = self.manager.handle_missing_logs()
         
-        if choice in ['1', '3', None]:
+        if choice in _INPUT_LOG_CHOICES:
             if not self.json.today_rated():
                 self.manager.input_todays_log()
         
+        # Styled once ANSI support is set, rather than on every loop
+        main_menu_header = (
+            f"🏠 {Txt("MAIN MENU").blue().underline().bold()} "
+            f"{Txt("— choose what to do:").bold()}"
+        )
+        
         while True:
-            print("\n*❖* —————————————————————————————— *❖*")
-            print(
-                f"🏠 {Txt("MAIN MENU").blue().underline().bold()} "
-                f"{Txt("— choose what to do:").bold()}"
-            )
-            opts = menu(
-                "1) 📈 View ratings [G]raph",
-                "2) 📝 Edit [T]oday's log...",
-                "3) 🕗 Edit [P]revious log...",
-                "4) 📊 See [S]tats",
-                "5) 📂 View [A]ll logs...",
-                "6) 💾 [B]ack up logs...",
-                "7) E[x]it",
-                title=None
-            )
+            print(_SEP_TOP)
+            print(main_menu_header)
+            opts = menu(*_MAIN_MENU_ITEMS, title=None)
             
-            match input("> ").lower().strip():
-                case '1' | 'g':
-                    if self.json.no_logs():
-                        err("You haven't entered any logs yet!")
-                        continue
-                    self.graph.view_ratings_graph()
-                    if not self.graph.graph_show_block:
-                        cont_on_enter()
-                        self.graph.close()
-                    else:
-                        print("\nGraph closed.")
-                
-                case '2' | 't':
-                    if not self.json.today_rated():
-                        err("You haven't entered today's log yet!")
-                        continue
-                    
-                    print(Txt("\nToday's log:").bold())
-                    today = _today.strftime(self.date_format)
-                    self.json.print_log(
-                        date=today,
-                        rating=self.json.get_rating(today),
-                        memory=self.json.get_memory(today),
-                    )
-                    
-                    while True:
-                        opts = menu(
-                            "1) Edit [R]ating",
-                            "2) Edit [M]emory entry",
-                            "3) Edit [B]oth",
-                            "4) [C]ancel -> Main menu",
-                        )
-                        
-                        match input("> ").strip().lower():
-                            case '1' | 'r':
-                                self.manager.change_todays_rating()
-                            case '2' | 'm':
-                                self.manager.change_todays_memory()
-                            case '3' | 'b':
-                                self.manager.change_todays_rating()
-                                self.manager.change_todays_memory()
-                            case '4' | 'c':
-                                break
-                            case _:
-                                invalid_choice(opts)
-                                continue
-                        break
-                
-                case '3' | 'p':
-                    if self.json.no_logs():
-                        err("You haven't entered any logs yet!")
-                        continue
-                    while True:
-                        selected_d = self.manager.prompt_prev_date()
-                        print(Txt("\nSelected log:").bold())
-                        self.json.print_log(
-                            date=selected_d,
-                            rating=self.json.get_rating(selected_d),
-                            memory=self.json.get_memory(selected_d),
-                        )
-                        
-                        while True:
-                            opts = menu(
-                                "1) Edit [R]ating",
-                                "2) Edit [M]emory entry",
-                                "3) Edit [B]oth",
-                                "4) Reselect [D]ate",
-                                "5) [C]ancel -> Main menu",
-                            )
-                            
-                            choice = input("> ").strip().lower()
-                            match choice:
-                                case '1' | 'r':
-                                    self.manager.change_previous_rating(
-                                        selected_d
-                                    )
-                                case '2' | 'm':
-                                    self.manager.change_previous_memory(
-                                        selected_d
-                                    )
-                                case '3' | 'b':
-                                    self.manager.change_previous_rating(
-                                        selected_d
-                                    )
-                                    self.manager.change_previous_memory(
-                                        selected_d
-                                    )
-                                case '4' | 'd':
-                                    break
-                                case '5' | 'c':
-                                    break
-                                case _:
-                                    invalid_choice(opts)
-                                    continue
-                            break
-                        
-                        if choice in ['4', 'd']:
-                            continue
-                        break
-                
-                case '4' | 's':
-                    self.stats.show_stats()
-                    cont_on_enter()
-                
-                case '5' | 'a':
-                    while True:
-                        opts = menu(
-                            "1) [P]rint logs to standard output",
-                            "2) [O]pen JSON file in default viewer/editor",
-                            "3) [C]ancel -> Main menu",
-                        )
-                        
-                        choice = input("> ").strip().lower()
-                        match choice:
-                            case '1' | 'p':
-                                self.json.print_logs_to_stdout()
-                            case '2' | 'o':
-                                self.json.open_json_file()
-                                cont_on_enter()
-                            case '3' | 'c':
-                                break
-                            case _:
-                                invalid_choice(opts)
-                                continue
-                        break
-                
-                case '6' | 'b':
-                    if self.json.no_logs():
-                        err("You haven't entered any logs yet!")
-                        continue
-                    self.json.backup_json_file()
-                
-                case '7' | 'x':
-                    print("\n*⎋* —————————————————————————————— *⎋*")
-                    print("\nBye!")
-                    raise SystemExit()
-                
-                case _:
-                    invalid_choice(opts)
+            handler = self._dispatch.get(input("> ").lower().strip())
+            if handler is None:
+                invalid_choice(opts)
+                continue
+            handler()
     
     def configure(self, **configs: int | str | bool | None) -> None:
         """Update configuration options via keyword arguments.
@@ -264,3 +184,125 @@ class Tracker:
                     f"'{config_name}', got {type(value).__name__} instead"
                 )
             setattr(self, config_name, value)
+    
+    def _handle_graph(self) -> None:
+        """Show the ratings graph."""
+        if self.json.no_logs():
+            err("You haven't entered any logs yet!")
+            return
+        try:
+            self.graph.view_ratings_graph()
+        except ModuleNotFoundError as e:
+            # matplotlib is unavailable; stay in the program
+            err(f"{e}.")
+            return
+        if not self.graph.graph_show_block:
+            cont_on_enter()
+            self.graph.close()
+        else:
+            print("\nGraph closed.")
+    
+    def _handle_edit_today(self) -> None:
+        """Show today's log and prompt which part of it to edit."""
+        if not self.json.today_rated():
+            err("You haven't entered today's log yet!")
+            return
+        
+        print(Txt("\nToday's log:").bold())
+        today = today_str(self.date_format)
+        self.json.print_log(
+            date=today,
+            rating=self.json.get_rating(today),
+            memory=self.json.get_memory(today),
+        )
+        
+        change_rating = self.manager.change_todays_rating
+        change_memory = self.manager.change_todays_memory
+        change_both = self.manager.change_todays_both
+        self._run_submenu(_TODAY_EDIT_ITEMS, {
+            '1': change_rating, 'r': change_rating,
+            '2': change_memory, 'm': change_memory,
+            '3': change_both, 'b': change_both,
+            '4': None, 'c': None,
+        })
+    
+    def _handle_edit_previous(self) -> None:
+        """Prompt a previous date and which part of its log to edit."""
+        if self.json.no_logs():
+            err("You haven't entered any logs yet!")
+            return
+        while True:
+            selected_d = self.manager.prompt_prev_date()
+            print(Txt("\nSelected log:").bold())
+            self.json.print_log(
+                date=selected_d,
+                rating=self.json.get_rating(selected_d),
+                memory=self.json.get_memory(selected_d),
+            )
+            
+            manager = self.manager
+            change_rating = partial(manager.change_previous_rating, selected_d)
+            change_memory = partial(manager.change_previous_memory, selected_d)
+            change_both = partial(manager.change_previous_both, selected_d)
+            choice = self._run_submenu(_PREV_EDIT_ITEMS, {
+                '1': change_rating, 'r': change_rating,
+                '2': change_memory, 'm': change_memory,
+                '3': change_both, 'b': change_both,
+                '4': None, 'd': None,
+                '5': None, 'c': None,
+            })
+            
+            if choice in _RESELECT_CHOICES:
+                continue
+            break
+    
+    def _handle_stats(self) -> None:
+        """Show rating stats."""
+        self.stats.show_stats()
+        cont_on_enter()
+    
+    def _handle_all_logs(self) -> None:
+        """Prompt how to view all saved logs."""
+        def open_file() -> None:
+            self.json.open_json_file()
+            cont_on_enter()
+        
+        self._run_submenu(_ALL_LOGS_ITEMS, {
+            '1': self.json.print_logs_to_stdout,
+            'p': self.json.print_logs_to_stdout,
+            '2': open_file, 'o': open_file,
+            '3': None, 'c': None,
+        })
+    
+    def _handle_backup(self) -> None:
+        """Back up the JSON logs file."""
+        if self.json.no_logs():
+            err("You haven't entered any logs yet!")
+            return
+        self.json.backup_json_file()
+    
+    @staticmethod
+    def _run_submenu(items: tuple[str, ...],
+                     actions: dict[str, Callable[[], None] | None]) -> str:
+        """Show a sub-menu until a valid choice is entered and run it.
+
+        `actions` maps each accepted input to its handler, or to None for
+        choices that only leave the menu. Return the chosen input.
+        """
+        while True:
+            opts = menu(*items)
+            choice = input("> ").strip().lower()
+            if choice not in actions:
+                invalid_choice(opts)
+                continue
+            action = actions[choice]
+            if action is not None:
+                action()
+            return choice
+    
+    @staticmethod
+    def _handle_exit() -> None:
+        """Exit the program."""
+        print(_SEP_BOT)
+        print("\nBye!")
+        raise SystemExit()
@@ -1,4 +1,5 @@
 import textwrap
+from functools import lru_cache
 from time import sleep
 from typing import TYPE_CHECKING
 
@@ -25,11 +26,8 @@ def cont_on_enter(msg: str = "[Press ENTER ↩ to return to main menu]") -> None
 def err(message: str, *desc: str, pause: bool = True) -> None:
     """Print formatted error message."""
     print(
-        Txt("\n❌ Error: ").bold().red()
-        + message
+        "\n".join((Txt("\n❌ Error: ").bold().red() + message, *desc))
     )
-    for d in desc:
-        print(d)
     if pause:
         sleep(1)
         
@@ -37,9 +35,11 @@ def err(message: str, *desc: str, pause: bool = True) -> None:
 def invalid_choice(opts: int,
                    letters_given: bool = True,
                    start: int = 1) -> None:
+    # No pause: the menu is reprinted right below, so the error stays visible
     err(
         f"Only enter a number {start}~{opts}"
-        f"{" or the given letters" if letters_given else ""}."
+        f"{" or the given letters" if letters_given else ""}.",
+        pause=False
     )
 
 
@@ -52,11 +52,26 @@ def log_saved(text: str = "Log saved!") -> None:
 def menu(*options: str | StyleText,
          title: str | StyleText | None = "Choose what to do: ") -> int:
     """Display menu options with title prompt. Return number of options."""
+    print(_render_menu(options, title, Txt.ansi_enabled))
+    return len(options)
+
+
+@lru_cache(maxsize=None)
+def _render_menu(options: tuple[str | StyleText, ...],
+                 title: str | StyleText | None,
+                 ansi_enabled: bool | None) -> str:
+    """Return the printed form of a menu.
+
+    Menus are redrawn with the same arguments on every loop, so the styled
+    text is built once and reused. `ansi_enabled` is only used as part of
+    the cache key, so toggling ANSI support re-renders the menu.
+    """
+    lines: list[str | StyleText] = []
     if title is not None:
-        print(Txt(f"\n{title}").bold())
+        lines.append(Txt(f"\n{title}").bold())
     for i, o in enumerate(options, 1):
-        print(Txt(f"{i})").bold(), o.removeprefix(f'{i}) '))
-    return len(options)
+        lines.append(f"{Txt(f"{i})").bold()} {o.removeprefix(f'{i}) ')}")
+    return Txt.render_many(lines, "\n")
 
 
 def print_wrapped(text: str, maxcol: int):
@@ -64,6 +79,12 @@ def print_wrapped(text: str, maxcol: int):
     leading_newlines = len(text) - len(text.lstrip('\n'))
     stripped = text.lstrip('\n')
 
-    wrapped = textwrap.fill(stripped, maxcol)
+    wrapped = _wrapper(maxcol).fill(stripped)
     print("\n" * leading_newlines + wrapped)
+
+
+@lru_cache(maxsize=8)
+def _wrapper(maxcol: int) -> textwrap.TextWrapper:
+    """Return a reusable TextWrapper for the given line width."""
+    return textwrap.TextWrapper(width=maxcol)
     
\ No newline at end of file
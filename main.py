@@ -1,14 +1,15 @@
 """Run this module to start Day Quality Tracker."""
 
 if __name__ == '__main__':
+    import sys
+    import traceback
+    
+    from dqt.styletext import StyleText as Txt
+    
     try:
         try:
-            import sys
-            import traceback
-            
             from dqt.tracker import Tracker
             from settings import CONFIGS
-            from dqt.styletext import StyleText as Txt
         except ModuleNotFoundError as e:
             print("\n*!* —————————————————————————————— *!*")
             print(Txt("\n❌ Error!").bold().red())